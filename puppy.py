@@ -1,19 +1,25 @@
+import hashlib
 import os
 import platform
+import shutil
 import subprocess
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
+from PIL import Image, ImageDraw
 from reportlab.lib import colors
-from reportlab.lib.colors import HexColor
 from reportlab.lib.pagesizes import A4, landscape
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.platypus import (
+    ActionFlowable,
     BaseDocTemplate,
+    Flowable,
     Frame,
-    NextPageTemplate,
     PageBreak,
     PageTemplate,
     Paragraph,
@@ -28,30 +34,103 @@ from reportlab.platypus import (
 
 file_path = Path(__file__).with_name("Molly_Training_Guide.pdf")
 assets_dir = file_path.with_name("assets")
-assets_dir.mkdir(exist_ok=True)
 
+PAGE_SIZE = landscape(A4)
+PAGE_WIDTH, PAGE_HEIGHT = PAGE_SIZE
+
+PALETTE_HEX = {
+    "ink": "#1C2A39",
+    "muted_green": "#628A7A",
+    "powder_blue": "#E1F3F7",
+    "soft_teal": "#A9D6CF",
+    "sage": "#CFE6DA",
+    "beige": "#F7F1EB",
+    "navy": "#2B3A42",
+    "sand": "#F2DFCE",
+    "accent": "#F4B860",
+}
 PALETTE = {
-    "ink": HexColor("#1C2A39"),
-    "muted_green": HexColor("#628A7A"),
-    "powder_blue": HexColor("#E1F3F7"),
-    "soft_teal": HexColor("#A9D6CF"),
-    "sage": HexColor("#CFE6DA"),
-    "beige": HexColor("#F7F1EB"),
-    "navy": HexColor("#2B3A42"),
-    "sand": HexColor("#F2DFCE"),
-    "accent": HexColor("#F4B860"),
+    name: colors.Color(int(value[1:3], 16) / 255, int(value[3:5], 16) / 255, int(value[5:7], 16) / 255)
+    for name, value in PALETTE_HEX.items()
 }
 
 
-def ensure_image(url: str, filename: str) -> Optional[Path]:
-    """Download background image if missing; return local path or None on failure."""
-    destination = assets_dir / filename
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# A4 landscape only needs ~1400px across for crisp print; anything wider just
+# bloats the embedded image streams.
+BACKGROUND_MAX_WIDTH = 1400
+
+
+def normalize_image(path: Path) -> None:
+    """Rewrite a downloaded background in place as a plain RGB baseline JPEG.
+
+    Shrinks it to BACKGROUND_MAX_WIDTH and drops EXIF/ICC metadata, which
+    Pillow does not carry over unless asked to.
+    """
+    with Image.open(path) as image:
+        normalized = image.convert("RGB")
+    if normalized.width > BACKGROUND_MAX_WIDTH:
+        height = round(normalized.height * BACKGROUND_MAX_WIDTH / normalized.width)
+        normalized = normalized.resize((BACKGROUND_MAX_WIDTH, height), Image.LANCZOS)
+    normalized.save(path, "JPEG", quality=82, optimize=True)
+
+
+def composed_name(filename: str) -> str:
+    return f"{Path(filename).stem}_composed.jpg"
+
+
+def compose_background(source: Path) -> Path:
+    """Bake the readability overlay and accent bar into a page-shaped copy of ``source``."""
+    destination = source.with_name(composed_name(source.name))
     if destination.exists():
         return destination
+    with Image.open(source) as image:
+        photo = image.convert("RGB")
+    # Raw files cached before downloads were normalized can still be 1920px wide.
+    width = min(photo.width, BACKGROUND_MAX_WIDTH)
+    height = round(width * PAGE_HEIGHT / PAGE_WIDTH)
+    scale = width / PAGE_WIDTH
+
+    # Fit the photo inside the page, centred, as drawImage(preserveAspectRatio=True) did.
+    fit = min(width / photo.width, height / photo.height)
+    fitted = photo.resize((round(photo.width * fit), round(photo.height * fit)), Image.LANCZOS)
+    frame = Image.new("RGB", (width, height), "white")
+    frame.paste(fitted, ((width - fitted.width) // 2, (height - fitted.height) // 2))
+
+    # Soft overlay for readability
+    frame = Image.blend(frame, Image.new("RGB", frame.size, "white"), 0.6)
+
+    # Accent bar (page coordinates are bottom-up, image rows top-down)
+    teal = tuple(round(channel * 255) for channel in PALETTE["soft_teal"].rgb())
+    ImageDraw.Draw(frame).rectangle(
+        (60 * scale, (PAGE_HEIGHT - 80) * scale, (PAGE_WIDTH - 60) * scale, (PAGE_HEIGHT - 60) * scale),
+        fill=teal,
+    )
+    frame.save(destination, "JPEG", quality=85, optimize=True)
+    return destination
+
+
+def ensure_image(url: str, filename: str) -> Optional[Path]:
+    """Download background image if missing; return composed local path or None on failure."""
+    destination = assets_dir / filename
+    if not destination.exists():
+        # Download and normalize under a temporary name so a truncated or
+        # non-image response never lands in the cache and gets retried next run.
+        partial = destination.with_suffix(".part")
+        try:
+            with urllib.request.urlopen(url) as response, open(partial, "wb") as handle:
+                shutil.copyfileobj(response, handle, DOWNLOAD_CHUNK_SIZE)
+            normalize_image(partial)
+            os.replace(partial, destination)
+        except Exception:
+            partial.unlink(missing_ok=True)
+            return None
     try:
-        urllib.request.urlretrieve(url, destination)
-        return destination
+        return compose_background(destination)
     except Exception:
+        # An unreadable cached file would otherwise block every future download.
+        destination.unlink(missing_ok=True)
         return None
 
 
@@ -99,7 +178,27 @@ BACKGROUND_SOURCES = [
     ),
 ]
 
-BACKGROUND_IMAGES = [ensure_image(url, name) for url, name in BACKGROUND_SOURCES]
+
+def load_background_images() -> List[Optional[Path]]:
+    """Return local background paths in BACKGROUND_SOURCES order, downloading any missing ones."""
+    assets_dir.mkdir(exist_ok=True)
+    # One directory listing tells us which assets are already cached; only the
+    # missing ones are fetched, concurrently since downloads are network-bound.
+    cached_assets = set(os.listdir(assets_dir))
+    missing_sources = [
+        (url, name) for url, name in BACKGROUND_SOURCES if composed_name(name) not in cached_assets
+    ]
+    downloaded = {}
+    if missing_sources:
+        with ThreadPoolExecutor(max_workers=len(missing_sources)) as executor:
+            results = executor.map(lambda source: ensure_image(*source), missing_sources)
+            downloaded = {name: path for (_, name), path in zip(missing_sources, results)}
+
+    return [
+        assets_dir / composed_name(name) if composed_name(name) in cached_assets else downloaded[name]
+        for _, name in BACKGROUND_SOURCES
+    ]
+
 
 # ---------------------------------------------------------------------------
 # Styles
@@ -210,57 +309,173 @@ styles.add(
 )
 
 
-def bullet(text: str) -> Paragraph:
-    return Paragraph(f"<bullet>&#9679;</bullet>{text}", styles["BulletStyle"])
+# Bind the custom styles once so slide construction skips the stylesheet lookups.
+TITLE, SUBTITLE, HEADING, SLIDE_SUBTITLE, BODY, BULLET, CALLOUT, CARD_TITLE, CARD_BODY = (
+    styles[name]
+    for name in (
+        "TitleStyle",
+        "SubtitleStyle",
+        "SlideHeading",
+        "SlideSubtitle",
+        "BodyCopy",
+        "BulletStyle",
+        "CalloutStyle",
+        "CardTitle",
+        "CardBody",
+    )
+)
+
+# Every card and every pastel table looks the same, so share one style each.
+CARD_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, -1), colors.Color(1, 1, 1, alpha=0.82)),
+        ("BOX", (0, 0), (-1, -1), 1, colors.Color(0.7, 0.8, 0.75)),
+        ("LEFTPADDING", (0, 0), (-1, -1), 12),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 12),
+        ("TOPPADDING", (0, 0), (-1, -1), 10),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 10),
+    ]
+)
+PASTEL_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.Color(1, 1, 1, alpha=0.75)),
+        ("TEXTCOLOR", (0, 0), (-1, 0), PALETTE["ink"]),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("GRID", (0, 0), (-1, -1), 0.4, colors.Color(0.8, 0.86, 0.9)),
+        ("BACKGROUND", (0, 1), (-1, -1), colors.Color(1, 1, 1, alpha=0.6)),
+        ("LEFTPADDING", (0, 0), (-1, -1), 8),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 8),
+        ("TOPPADDING", (0, 0), (-1, -1), 6),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+    ]
+)
 
 
 def callout(text: str) -> Paragraph:
-    return Paragraph(text, styles["CalloutStyle"])
+    return Paragraph(text, CALLOUT)
 
 
 def card(title: str, body: str) -> Table:
     data = [
-        [Paragraph(f"<b>{title}</b>", styles["CardTitle"])],
-        [Paragraph(body, styles["CardBody"])],
+        [Paragraph(f"<b>{title}</b>", CARD_TITLE)],
+        [Paragraph(body, CARD_BODY)],
     ]
     table = Table(data, colWidths=[360])
-    table.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, -1), colors.Color(1, 1, 1, alpha=0.82)),
-                ("BOX", (0, 0), (-1, -1), 1, colors.Color(0.7, 0.8, 0.75)),
-                ("LEFTPADDING", (0, 0), (-1, -1), 12),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 12),
-                ("TOPPADDING", (0, 0), (-1, -1), 10),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 10),
-            ]
-        )
-    )
+    table.setStyle(CARD_TABLE_STYLE)
     return table
 
 
 def pastel_table(data: List[List[str]], col_widths: List[int]) -> Table:
     table = Table(data, colWidths=col_widths, repeatRows=1, hAlign="LEFT")
-    table.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.Color(1, 1, 1, alpha=0.75)),
-                ("TEXTCOLOR", (0, 0), (-1, 0), PALETTE["ink"]),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("GRID", (0, 0), (-1, -1), 0.4, colors.Color(0.8, 0.86, 0.9)),
-                ("BACKGROUND", (0, 1), (-1, -1), colors.Color(1, 1, 1, alpha=0.6)),
-                ("LEFTPADDING", (0, 0), (-1, -1), 8),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 8),
-                ("TOPPADDING", (0, 0), (-1, -1), 6),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-            ]
-        )
-    )
+    table.setStyle(PASTEL_TABLE_STYLE)
     return table
 
 
+class BulletColumn(Flowable):
+    """A run of plain-text bullets laid out with string metrics alone.
+
+    Stands in for one Paragraph per bullet: words are wrapped by stringWidth
+    and drawn with drawString, skipping Paragraph's markup parser. Texts must
+    therefore be plain strings, not ReportLab markup; anything containing
+    ``<`` or ``&`` is rejected rather than printed literally. Spacing matches
+    what a frame gives consecutive Paragraphs in ``style``.
+    """
+
+    glyph = "\u25cf"
+
+    def __init__(self, texts: List[str], style: ParagraphStyle = BULLET) -> None:
+        super().__init__()
+        for text in texts:
+            if "<" in text or "&" in text:
+                raise ValueError(f"BulletColumn takes plain text, not Paragraph markup: {text!r}")
+        self.texts = texts
+        self.style = style
+        self.lines: List[List[str]] = []
+
+    @property
+    def gap(self) -> float:
+        # Frames overlap one paragraph's spaceAfter with the next one's spaceBefore.
+        return max(self.style.spaceBefore, self.style.spaceAfter)
+
+    @property
+    def first_indent(self) -> float:
+        # Same rule as Paragraph: the first line starts after the bullet if it overruns leftIndent.
+        style = self.style
+        bullet_end = (
+            style.bulletIndent
+            + stringWidth(self.glyph, style.bulletFontName, style.bulletFontSize)
+            + 0.6 * style.bulletFontSize
+        )
+        return max(style.leftIndent, bullet_end)
+
+    def split_text(self, text: str, availWidth: float) -> List[str]:
+        # Greedy word wrap; the first line is narrower when the bullet pushes it right.
+        style = self.style
+        space = stringWidth(" ", style.fontName, style.fontSize)
+        max_width = availWidth - self.first_indent - style.rightIndent
+        lines: List[str] = []
+        words: List[str] = []
+        used = 0.0
+        for word in text.split():
+            word_width = stringWidth(word, style.fontName, style.fontSize)
+            if words and used + space + word_width > max_width:
+                lines.append(" ".join(words))
+                words, used = [], 0.0
+                max_width = availWidth - style.leftIndent - style.rightIndent
+            used += (space if words else 0.0) + word_width
+            words.append(word)
+        if words:
+            lines.append(" ".join(words))
+        return lines
+
+    def wrap(self, availWidth, availHeight):
+        style = self.style
+        self.lines = [self.split_text(text, availWidth) for text in self.texts]
+        line_count = sum(len(lines) for lines in self.lines)
+        self.width = availWidth
+        self.height = line_count * style.leading + self.gap * (len(self.texts) - 1)
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        # Break between bullets, never inside one.
+        self.wrap(availWidth, availHeight)
+        used = 0.0
+        for idx, lines in enumerate(self.lines):
+            used += len(lines) * self.style.leading
+            if used > availHeight:
+                if idx == 0:
+                    return []
+                return [BulletColumn(self.texts[:idx], self.style), BulletColumn(self.texts[idx:], self.style)]
+            used += self.gap
+        return [self]
+
+    def getSpaceBefore(self):
+        return self.style.spaceBefore
+
+    def getSpaceAfter(self):
+        return self.style.spaceAfter
+
+    def draw(self):
+        style = self.style
+        canvas = self.canv
+        top = self.height
+        for lines in self.lines:
+            baseline = top - style.fontSize
+            canvas.setFont(style.bulletFontName, style.bulletFontSize)
+            canvas.setFillColor(style.bulletColor)
+            canvas.drawString(style.bulletIndent, baseline, self.glyph)
+            canvas.setFont(style.fontName, style.fontSize)
+            canvas.setFillColor(style.textColor)
+            indent = self.first_indent
+            for line in lines:
+                canvas.drawString(indent, baseline, line)
+                baseline -= style.leading
+                indent = style.leftIndent
+            top -= len(lines) * style.leading + self.gap
+
+
 # ---------------------------------------------------------------------------
 # Slide content
 # ---------------------------------------------------------------------------
@@ -271,61 +486,81 @@ class Slide:
     elements: List
 
 
-slides: List[Slide] = [
-    Slide(
-        background=BACKGROUND_IMAGES[0],
+def build_slides(backgrounds: List[Optional[Path]]) -> Iterator[Slide]:
+    """Yield the deck slide by slide, pairing each with one of the given backgrounds.
+
+    BulletColumn entries are plain text: no ``<b>``, entities or other Paragraph markup.
+    """
+    yield Slide(
+        background=backgrounds[0],
         elements=[
-            Paragraph("Molly × Luna", styles["TitleStyle"]),
-            Paragraph("Calm Companion Keynote Guide", styles["SubtitleStyle"]),
+            Paragraph("Molly × Luna", TITLE),
+            Paragraph("Calm Companion Keynote Guide", SUBTITLE),
             Spacer(1, 20),
             callout(
                 "World-class plan: raise a golden retriever who radiates confidence, adores her cat sister, "
                 "and floats through the home with calm, Canva-worthy grace."
             ),
         ],
-    ),
-    Slide(
-        background=BACKGROUND_IMAGES[1],
+    )
+
+    yield Slide(
+        background=backgrounds[1],
         elements=[
-            Paragraph("Training Mindset", styles["SlideHeading"]),
-            Paragraph("Short reps • generous rewards • end on a high note", styles["SlideSubtitle"]),
-            bullet("1–3 minute micro-sessions, 3–5 times a day, layered between rest and play."),
-            bullet("Reward early and often—happy brains learn cues in half the reps."),
-            bullet("Use baby gates, tethers, and the x-pen like a backstage crew keeping the show seamless."),
-            bullet("Capture wins in a shared note—patterns appear quickly when you track the glow-ups."),
+            Paragraph("Training Mindset", HEADING),
+            Paragraph("Short reps • generous rewards • end on a high note", SLIDE_SUBTITLE),
+            BulletColumn(
+                [
+                    "1–3 minute micro-sessions, 3–5 times a day, layered between rest and play.",
+                    "Reward early and often—happy brains learn cues in half the reps.",
+                    "Use baby gates, tethers, and the x-pen like a backstage crew keeping the show seamless.",
+                    "Capture wins in a shared note—patterns appear quickly when you track the glow-ups.",
+                ]
+            ),
         ],
-    ),
-    Slide(
-        background=BACKGROUND_IMAGES[2],
+    )
+
+    yield Slide(
+        background=backgrounds[2],
         elements=[
-            Paragraph("Studio Setup Checklist", styles["SlideHeading"]),
-            bullet("42\" crate with divider, sleek x-pen, and two stylish baby gates to zone the space."),
-            bullet("Chew gallery: stuffable rubber, long-lasting chew, velvet-soft chew for variety."),
-            bullet("6-ft leash, flat collar, front-clip harness ready for the growth spurt."),
-            bullet("Treat palette: pea-sized rewards or kibble for endless rapid-fire reps."),
-            bullet("Luna’s lounge: elevated dining, gated litter spa, multiple escape catwalks."),
+            Paragraph("Studio Setup Checklist", HEADING),
+            BulletColumn(
+                [
+                    "42\" crate with divider, sleek x-pen, and two stylish baby gates to zone the space.",
+                    "Chew gallery: stuffable rubber, long-lasting chew, velvet-soft chew for variety.",
+                    "6-ft leash, flat collar, front-clip harness ready for the growth spurt.",
+                    "Treat palette: pea-sized rewards or kibble for endless rapid-fire reps.",
+                    "Luna’s lounge: elevated dining, gated litter spa, multiple escape catwalks.",
+                ]
+            ),
             callout("Night-before ritual: scent swap by trading soft cloths rubbed on each pet—instant familiarity."),
         ],
-    ),
-    Slide(
-        background=BACKGROUND_IMAGES[3],
+    )
+
+    yield Slide(
+        background=backgrounds[3],
         elements=[
-            Paragraph("First 48 Hours", styles["SlideHeading"]),
-            Paragraph("Create the calm landing that Canva dreams are made of.", styles["SlideSubtitle"]),
-            bullet("Stage one ‘base camp’ room with cozy textures and soft lighting."),
-            bullet("Crate confetti: toss 5–10 treats, close the door for a gentle 5-count, reopen, repeat."),
-            bullet("Potty autopilot: outdoors after naps, meals, play bursts, and every 45–60 minutes awake."),
-            bullet("Scent-only meetups: swap spaces while one pet explores the other’s vibe solo."),
+            Paragraph("First 48 Hours", HEADING),
+            Paragraph("Create the calm landing that Canva dreams are made of.", SLIDE_SUBTITLE),
+            BulletColumn(
+                [
+                    "Stage one ‘base camp’ room with cozy textures and soft lighting.",
+                    "Crate confetti: toss 5–10 treats, close the door for a gentle 5-count, reopen, repeat.",
+                    "Potty autopilot: outdoors after naps, meals, play bursts, and every 45–60 minutes awake.",
+                    "Scent-only meetups: swap spaces while one pet explores the other’s vibe solo.",
+                ]
+            ),
             card(
                 "Pro Tip",
                 "Play low-volume spa music and diffuse a pet-safe calming scent. It helps both Molly and Luna exhale.",
             ),
         ],
-    ),
-    Slide(
-        background=BACKGROUND_IMAGES[4],
+    )
+
+    yield Slide(
+        background=backgrounds[4],
         elements=[
-            Paragraph("Signature Day (Weeks 8–12)", styles["SlideHeading"]),
+            Paragraph("Signature Day (Weeks 8–12)", HEADING),
             pastel_table(
                 [
                     ["Time", "Design of the Moment"],
@@ -343,43 +578,59 @@ slides: List[Slide] = [
             ),
             callout("Movement guide: ~5 minutes of structured exercise per month of age, 2–3×/day, plus rich sniffing adventures."),
         ],
-    ),
-    Slide(
-        background=BACKGROUND_IMAGES[5],
+    )
+
+    yield Slide(
+        background=backgrounds[5],
         elements=[
-            Paragraph("Potty & Crate Wins", styles["SlideHeading"]),
-            bullet("Supervision or soft confinement keeps rehearsal perfect—no free-roam until she’s nailing it."),
-            bullet("Same potty runway every time; whisper the cue mid-go; celebrate within two seconds."),
-            bullet("Accidents: gentle clap, straight outside, then enzymatic cleanup—no drama, all data."),
-            bullet("Crate ladder: treat tosses → quick door closes → stuffed chew calm → fade your presence."),
-            bullet("Alone-time arc: gated room → tiny departures → 15–30 min errands, building toward 60."),
+            Paragraph("Potty & Crate Wins", HEADING),
+            BulletColumn(
+                [
+                    "Supervision or soft confinement keeps rehearsal perfect—no free-roam until she’s nailing it.",
+                    "Same potty runway every time; whisper the cue mid-go; celebrate within two seconds.",
+                    "Accidents: gentle clap, straight outside, then enzymatic cleanup—no drama, all data.",
+                    "Crate ladder: treat tosses → quick door closes → stuffed chew calm → fade your presence.",
+                    "Alone-time arc: gated room → tiny departures → 15–30 min errands, building toward 60.",
+                ]
+            ),
         ],
-    ),
-    Slide(
-        background=BACKGROUND_IMAGES[6],
+    )
+
+    yield Slide(
+        background=backgrounds[6],
         elements=[
-            Paragraph("Skill Sessions", styles["SlideHeading"]),
-            Paragraph("Micro-reps that feel like play.", styles["SlideSubtitle"]),
-            bullet("Bite inhibition: rotate 2–3 legal chews daily; redirect nips instantly."),
-            bullet("Timeouts: 30–60 sec behind a baby gate if mouthing persists (crate stays a zen den)."),
-            bullet("Core cues: name sparkle, sit/down rhythms, hallway come ping-pong, leave-it ladder, drop trades, settle-on-mat bliss."),
-            bullet("Greeting etiquette: pay four paws on the floor, cue sits, use leashes or x-pen for guest entrances."),
+            Paragraph("Skill Sessions", HEADING),
+            Paragraph("Micro-reps that feel like play.", SLIDE_SUBTITLE),
+            BulletColumn(
+                [
+                    "Bite inhibition: rotate 2–3 legal chews daily; redirect nips instantly.",
+                    "Timeouts: 30–60 sec behind a baby gate if mouthing persists (crate stays a zen den).",
+                    "Core cues: name sparkle, sit/down rhythms, hallway come ping-pong, leave-it ladder, drop trades, settle-on-mat bliss.",
+                    "Greeting etiquette: pay four paws on the floor, cue sits, use leashes or x-pen for guest entrances.",
+                ]
+            ),
         ],
-    ),
-    Slide(
-        background=BACKGROUND_IMAGES[7],
+    )
+
+    yield Slide(
+        background=backgrounds[7],
         elements=[
-            Paragraph("Socialization Mood Board", styles["SlideHeading"]),
-            bullet("1–2 fresh experiences daily—quit while she’s curious, not overwhelmed."),
-            bullet("Pair every new human, surface, sound, or vehicle with soft treats and exit on a smile."),
-            bullet("Secure car rides with a crate or crash-tested harness; rehearse vet-table handling with steady pay."),
-            bullet("Leave before she asks to—confidence grows when sessions end on ‘I want more!’"),
+            Paragraph("Socialization Mood Board", HEADING),
+            BulletColumn(
+                [
+                    "1–2 fresh experiences daily—quit while she’s curious, not overwhelmed.",
+                    "Pair every new human, surface, sound, or vehicle with soft treats and exit on a smile.",
+                    "Secure car rides with a crate or crash-tested harness; rehearse vet-table handling with steady pay.",
+                    "Leave before she asks to—confidence grows when sessions end on ‘I want more!’",
+                ]
+            ),
         ],
-    ),
-    Slide(
-        background=BACKGROUND_IMAGES[8],
+    )
+
+    yield Slide(
+        background=backgrounds[8],
         elements=[
-            Paragraph("Cat × Puppy Blueprint", styles["SlideHeading"]),
+            Paragraph("Cat × Puppy Blueprint", HEADING),
             pastel_table(
                 [
                     ["Phase", "Timing", "Signature Moves"],
@@ -394,11 +645,12 @@ slides: List[Slide] = [
             ),
             callout("Feed & train Molly before cat sessions. Give Luna private play parties while Molly relaxes with a chew."),
         ],
-    ),
-    Slide(
-        background=BACKGROUND_IMAGES[9],
+    )
+
+    yield Slide(
+        background=backgrounds[9],
         elements=[
-            Paragraph("Milestone Roadmap", styles["SlideHeading"]),
+            Paragraph("Milestone Roadmap", HEADING),
             pastel_table(
                 [
                     ["Timeline", "Celebrate This"],
@@ -409,50 +661,66 @@ slides: List[Slide] = [
                 ],
                 [120, 370],
             ),
-            Paragraph("Common Hiccups", styles["SlideHeading"]),
-            bullet("Laser focus on Luna? Add distance, boost treat value, rehearse settle-on-mat, pre-session sniff walk."),
-            bullet("Cat swats or hisses? Give Luna a dog-free day, reset to barriers, elevate escape routes."),
-            bullet("Potty regression? Tighten to a 45-minute timer, shrink roaming area for 3–5 days."),
-            bullet("Night waking? Keep evenings zen, last potty right before lights out, quiet overnight escort, zero party vibes."),
+            Paragraph("Common Hiccups", HEADING),
+            BulletColumn(
+                [
+                    "Laser focus on Luna? Add distance, boost treat value, rehearse settle-on-mat, pre-session sniff walk.",
+                    "Cat swats or hisses? Give Luna a dog-free day, reset to barriers, elevate escape routes.",
+                    "Potty regression? Tighten to a 45-minute timer, shrink roaming area for 3–5 days.",
+                    "Night waking? Keep evenings zen, last potty right before lights out, quiet overnight escort, zero party vibes.",
+                ]
+            ),
         ],
-    ),
-    Slide(
-        background=BACKGROUND_IMAGES[0],
+    )
+
+    yield Slide(
+        background=backgrounds[0],
         elements=[
-            Paragraph("Safety Signals & Trainer Faves", styles["SlideHeading"]),
-            bullet("Dog stress whispers: whale eye, lip lick outside treats, tight yawns, freezing, slow tail sweep."),
-            bullet("Cat stress cues: pinned ears, tucked tail, dilated pupils, tail thumps, crouched stillness."),
-            bullet("Spot stress? Dial back intensity, switch to easy wins, wrap with something joyful."),
-            bullet("Teach: hand target redirect, go-to-mat parking cue, find-it scatter for instant decompression."),
-            Paragraph("Daily & Weekly Rhythm", styles["SlideHeading"]),
-            bullet("Daily: three micro-training snacks, two crate rests with chews, one to two enrichment feeders."),
-            bullet("Weekly: one new calm location, one fresh surface or sound, one new person at Molly’s comfort distance."),
-            bullet("Meals: three/day until ~12 weeks, then two. Funnel part into training paychecks."),
-            bullet("Toolkit: crate + divider, x-pen, baby gates, flat collar, 6-ft leash, long line, front-clip harness, treat pouch, chew trio."),
+            Paragraph("Safety Signals & Trainer Faves", HEADING),
+            BulletColumn(
+                [
+                    "Dog stress whispers: whale eye, lip lick outside treats, tight yawns, freezing, slow tail sweep.",
+                    "Cat stress cues: pinned ears, tucked tail, dilated pupils, tail thumps, crouched stillness.",
+                    "Spot stress? Dial back intensity, switch to easy wins, wrap with something joyful.",
+                    "Teach: hand target redirect, go-to-mat parking cue, find-it scatter for instant decompression.",
+                ]
+            ),
+            Paragraph("Daily & Weekly Rhythm", HEADING),
+            BulletColumn(
+                [
+                    "Daily: three micro-training snacks, two crate rests with chews, one to two enrichment feeders.",
+                    "Weekly: one new calm location, one fresh surface or sound, one new person at Molly’s comfort distance.",
+                    "Meals: three/day until ~12 weeks, then two. Funnel part into training paychecks.",
+                    "Toolkit: crate + divider, x-pen, baby gates, flat collar, 6-ft leash, long line, front-clip harness, treat pouch, chew trio.",
+                ]
+            ),
         ],
-    ),
-    Slide(
-        background=BACKGROUND_IMAGES[1],
+    )
+
+    yield Slide(
+        background=backgrounds[1],
         elements=[
-            Paragraph("Wrap with Joy", styles["SlideHeading"]),
+            Paragraph("Wrap with Joy", HEADING),
             callout(
                 "Every calm glance, every polite pass-by, every shared nap is a slide-worthy win. "
                 "Celebrate relentlessly—it cements the friendship you’re crafting."
             ),
-            bullet("Keep notes on what lights Molly up and what soothes Luna."),
-            bullet("When progress sticks, zoom out, simplify, and reboot with kindness."),
-            bullet("You’ve got this—and I’m just a message away whenever you want to iterate."),
-            Paragraph("— Your Calm Companion Coach", styles["SlideSubtitle"]),
+            BulletColumn(
+                [
+                    "Keep notes on what lights Molly up and what soothes Luna.",
+                    "When progress sticks, zoom out, simplify, and reboot with kindness.",
+                    "You’ve got this—and I’m just a message away whenever you want to iterate.",
+                ]
+            ),
+            Paragraph("— Your Calm Companion Coach", SLIDE_SUBTITLE),
         ],
-    ),
-]
+    )
+
 
 # ---------------------------------------------------------------------------
 # Document assembly
 # ---------------------------------------------------------------------------
 
-PAGE_SIZE = landscape(A4)
-PAGE_WIDTH, PAGE_HEIGHT = PAGE_SIZE
 CONTENT_FRAME = Frame(
     90,
     90,
@@ -462,30 +730,40 @@ CONTENT_FRAME = Frame(
 )
 
 
-def make_on_page(background: Optional[Path]):
+class NextBackground(ActionFlowable):
+    """Switch the background from the next page on, as NextPageTemplate does for templates.
+
+    Pages a slide overflows onto keep that slide's background.
+    """
+
+    def __init__(self, background: Optional[Path]) -> None:
+        super().__init__()
+        self.background = background
+
+    def apply(self, doc):
+        doc.slide_background = self.background
+
+
+def make_on_page():
+    """Build the shared onPage callback; it draws whichever background NextBackground last set."""
+
     def _on_page(canvas, doc):
+        background = doc.slide_background
         canvas.saveState()
-        if background and background.exists():
-            canvas.drawImage(
-                str(background),
-                0,
-                0,
-                width=PAGE_WIDTH,
-                height=PAGE_HEIGHT,
-                preserveAspectRatio=True,
-                anchor="c",
-            )
+        if background is not None:
+            # Overlay and accent bar are already baked in by compose_background.
+            canvas.drawImage(str(background), 0, 0, width=PAGE_WIDTH, height=PAGE_HEIGHT)
         else:
             canvas.setFillColor(PALETTE["beige"])
             canvas.rect(0, 0, PAGE_WIDTH, PAGE_HEIGHT, fill=True, stroke=False)
 
-        # Soft overlay for readability
-        canvas.setFillColor(colors.Color(1, 1, 1, alpha=0.6))
-        canvas.rect(0, 0, PAGE_WIDTH, PAGE_HEIGHT, fill=True, stroke=False)
+            # Soft overlay for readability
+            canvas.setFillColor(colors.Color(1, 1, 1, alpha=0.6))
+            canvas.rect(0, 0, PAGE_WIDTH, PAGE_HEIGHT, fill=True, stroke=False)
 
-        # Accent bar
-        canvas.setFillColor(PALETTE["soft_teal"])
-        canvas.rect(60, 60, PAGE_WIDTH - 120, 20, fill=True, stroke=False)
+            # Accent bar
+            canvas.setFillColor(PALETTE["soft_teal"])
+            canvas.rect(60, 60, PAGE_WIDTH - 120, 20, fill=True, stroke=False)
 
         # Footer
         canvas.setFont("Helvetica", 10)
@@ -497,42 +775,87 @@ def make_on_page(background: Optional[Path]):
     return _on_page
 
 
-doc = BaseDocTemplate(
-    str(file_path),
-    pagesize=PAGE_SIZE,
-    rightMargin=0,
-    leftMargin=0,
-    topMargin=0,
-    bottomMargin=0,
-)
+def build_pdf(path: Path) -> None:
+    """Download any missing backgrounds and render the keynote to ``path``."""
 
-templates = [
-    PageTemplate(id=f"Slide{idx}", frames=[CONTENT_FRAME], onPage=make_on_page(slide.background))
-    for idx, slide in enumerate(slides)
-]
-for template in templates:
-    doc.addPageTemplates(template)
+    doc = BaseDocTemplate(
+        str(path),
+        pagesize=PAGE_SIZE,
+        rightMargin=0,
+        leftMargin=0,
+        topMargin=0,
+        bottomMargin=0,
+    )
+
+    doc.addPageTemplates(PageTemplate(id="Slide", frames=[CONTENT_FRAME], onPage=make_on_page()))
+
+    def flowable_runs() -> Iterator[List]:
+        for idx, slide in enumerate(build_slides(load_background_images())):
+            background = slide.background if slide.background and slide.background.exists() else None
+            if idx == 0:
+                # The first page begins before any flowable is handled, so seed it directly.
+                doc.slide_background = background
+            else:
+                yield [NextBackground(background), PageBreak()]
+            yield slide.elements
+
+    # Flatten the page breaks and slide elements in one pass rather than growing the list piecemeal.
+    story = list(chain.from_iterable(flowable_runs()))
+
+    doc.build(story)
 
-story: List = []
-for idx, slide in enumerate(slides):
-    if idx > 0:
-        story.append(NextPageTemplate(f"Slide{idx}"))
-        story.append(PageBreak())
-    story.extend(slide.elements)
 
-doc.build(story)
+def launch_detached(command: List[str]) -> None:
+    subprocess.Popen(
+        command,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
 
 
 def open_pdf(path: Path) -> None:
-    """Open the generated PDF with the default system viewer."""
+    """Open the generated PDF with the default system viewer without waiting for it."""
     system = platform.system()
     if system == "Darwin":
-        subprocess.run(["open", str(path)], check=True)
+        launch_detached(["open", str(path)])
     elif system == "Windows":
         os.startfile(str(path))  # type: ignore[attr-defined]
     else:
-        subprocess.run(["xdg-open", str(path)], check=True)
+        launch_detached(["xdg-open", str(path)])
+
+
+def build_stamp() -> Optional[str]:
+    """Fingerprint this script and the composed backgrounds; None if any background is missing.
+
+    A missing background keeps the PDF stale, so the next run rebuilds and
+    ensure_image retries the download.
+    """
+    digest = hashlib.sha1(Path(__file__).read_bytes())
+    for _, name in BACKGROUND_SOURCES:
+        background = assets_dir / composed_name(name)
+        if not background.exists():
+            return None
+        stat = background.stat()
+        digest.update(f"{background.name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+def pdf_is_current(path: Path, stamp: Optional[str]) -> bool:
+    """True when ``path`` was built from the inputs fingerprinted by ``stamp``."""
+    stamp_path = path.with_suffix(".stamp")
+    return stamp is not None and path.exists() and stamp_path.exists() and stamp_path.read_text() == stamp
 
 
 if __name__ == "__main__":
+    if not pdf_is_current(file_path, build_stamp()):
+        build_pdf(file_path)
+        # Backgrounds may have been downloaded during the build, so fingerprint afterwards.
+        stamp = build_stamp()
+        stamp_path = file_path.with_suffix(".stamp")
+        if stamp is not None:
+            stamp_path.write_text(stamp)
+        else:
+            # Some downloads failed; drop any old stamp so the next run retries them.
+            stamp_path.unlink(missing_ok=True)
     open_pdf(file_path)